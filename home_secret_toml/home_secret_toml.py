@@ -50,16 +50,12 @@ You can also specify a custom path when creating a HomeSecretToml instance.
 
 import typing as T
 import sys
+import copy
 import argparse
-
-try:
-    import tomllib
-except ImportError:  # pragma: no cover
-    import tomli as tomllib
-import textwrap
 import dataclasses
+import collections
 from pathlib import Path
-from functools import cached_property
+import functools
 
 __version__ = "0.2.1"
 __license__ = "MIT"
@@ -76,39 +72,97 @@ p_home_secret = Path.home() / filename
 p_here_enum = Path("home_secret_enum.py")
 
 
-def _deep_get(
+@functools.lru_cache(maxsize=None)
+def _get_tomllib():
+    """
+    Import and return the TOML parser module on first use.
+
+    The import is deferred so importing this module stays cheap for code that
+    never reads the secret file. The result is cached, so on Python < 3.11 the
+    failing ``import tomllib`` (a full ``sys.path`` scan) happens only once
+    instead of on every load before falling back to ``tomli``.
+    """
+    try:
+        import tomllib
+    except ImportError:  # pragma: no cover
+        import tomli as tomllib
+    return tomllib
+
+
+def _key_not_found(
     dct: dict,
     path: str,
-) -> T.Any:
+) -> KeyError:
     """
-    Retrieve a nested value from a dictionary using dot-separated path notation.
+    Build the ``KeyError`` for a path that isn't in the flat lookup table.
 
-    This function enables accessing deeply nested dictionary values using a simple
-    string path like "github.accounts.personal.account_id". Since TOML parses
-    dotted keys as nested dictionaries, this function traverses the nested structure.
+    This is only called on the error path, so the partial path showing exactly
+    which key was missing is computed here instead of during the lookup.
 
-    :param dct: The dictionary to search through
-    :param path: Dot-separated path to the desired value (e.g., "github.accounts.personal.account_id")
+    :param dct: The dictionary that was searched
+    :param path: Dot-separated path that failed to resolve
 
-    :raises KeyError: When any part of the path doesn't exist in the dictionary
-
-    :return: The value found at the specified path
+    :return: KeyError with a message naming the first missing key path
     """
-    value = dct  # Start with the root dictionary
+    value = dct
     parts = list()
-    # Navigate through each part of the dot-separated path
     for part in path.split("."):
         parts.append(part)
         if isinstance(value, dict) and part in value:
-            value = value[part]  # Move deeper into the nested structure
+            value = value[part]
         else:
-            # Provide clear error message showing exactly what key was missing
-            current_path = ".".join(parts)
-            raise KeyError(f"Key {current_path!r} not found in the provided data.")
-    return value
+            break
+    current_path = ".".join(parts)
+    return KeyError(f"Key {current_path!r} not found in the provided data.")
+
+
+def _flatten(
+    dct: dict[str, T.Any],
+) -> dict[str, T.Any]:
+    """
+    Flatten a nested dictionary into a single ``{dot_path: value}`` table.
+
+    Every node is recorded, including intermediate dictionaries, so looking up
+    a sub-tree like "aws.accounts.prod" works the same as looking up a leaf.
+    Unlike :func:`walk`, nothing is filtered out. This turns a nested tree
+    walk into a single dict lookup.
+
+    A path maps to the value reached by splitting it on dots and indexing the
+    nested dictionaries one segment at a time. Quoted keys that contain a dot
+    (e.g. ``"x.a".b``) can't be reached that way, so they and their sub-trees
+    are left out instead of shadowing the nested path they would otherwise be
+    joined into.
+
+    :param dct: Dictionary to flatten (typically the loaded secrets TOML)
+
+    :return: Flat dictionary mapping dot-separated paths to values
+    """
+    flat = dict()
+    # Explicit stack instead of recursion, so deeply nested files can't hit
+    # the interpreter's recursion limit. Prefixes are tuples of key segments,
+    # so empty keys (``"".a``) join the same way the lookup splits them
+    stack = [((), dct)]
+    while stack:
+        parent_parts, node = stack.pop()
+        for key, value in node.items():
+            if "." in key:
+                continue
+            parts = parent_parts + (key,)
+            # Interned, so lookups with interned paths (tokens, hs.t) match
+            # by identity and equal paths share one string object
+            path = sys.intern(".".join(parts))
+            flat[path] = value
+            if isinstance(value, dict):
+                stack.append((parts, value))
+    return flat
+
+
+_MISSING = object()
+"""
+Sentinel marking a :class:`Token` whose value has not been resolved yet.
+"""
 
 
-@dataclasses.dataclass
 class Token:
     """
     A lazy-loading token that represents a reference to a secret value.
@@ -121,12 +175,67 @@ class Token:
     - **Reference Flexibility**: Tokens can be passed around and stored before resolution
     - **Error Isolation**: TOML parsing errors only occur when values are accessed
 
-    :param data: Reference to the loaded TOML data dictionary
+    The value is resolved on first access and remembered on the token, so
+    reading ``.v`` repeatedly (e.g. inside a loop) is just a version check.
+    After :meth:`HomeSecretToml.reload` the value is resolved again from the
+    fresh data, for every token of that instance however it was created.
+
+    Tokens are immutable: ``hs`` and ``path`` are read-only. Two tokens are
+    equal when they point to the same path of the same :class:`HomeSecretToml`,
+    and the hash is computed once at construction, so tokens are cheap dict keys.
+
+    A token only keeps a reference to its :class:`HomeSecretToml`, not to the
+    parsed data, so creating a token never triggers reading the secret file.
+
+    :param hs: The :class:`HomeSecretToml` instance the secret is read from
     :param path: Dot-separated path to the secret value within the TOML structure
     """
 
-    data: dict[str, T.Any] = dataclasses.field()
-    path: str = dataclasses.field()
+    __slots__ = ("_hs", "_path", "_hash", "_v", "_version")
+
+    def __init__(
+        self,
+        hs: "HomeSecretToml",
+        path: str,
+    ):
+        self._hs = hs
+        self._path = sys.intern(path)
+        self._hash = hash((id(hs), self._path))
+        self._v = _MISSING
+        # HomeSecretToml._cache_version the value was resolved at, -1 = never
+        self._version = -1
+
+    @property
+    def hs(self) -> "HomeSecretToml":
+        """
+        The :class:`HomeSecretToml` instance the secret is read from.
+        """
+        return self._hs
+
+    @property
+    def path(self) -> str:
+        """
+        Dot-separated path to the secret value within the TOML structure.
+        """
+        return self._path
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self._path!r})"
+
+    def __eq__(self, other: T.Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._hs is other._hs and self._path == other._path
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Rebuild through __init__ on unpickle / copy, so the identity-based
+        # hash is recomputed and the resolved value isn't serialized. The
+        # owning HomeSecretToml is pickled without its parsed data, see
+        # HomeSecretToml.__getstate__
+        return self.__class__, (self._hs, self._path)
 
     @property
     def v(self) -> T.Any:
@@ -135,10 +244,14 @@ class Token:
 
         :return: The secret value at the specified path
         """
-        return _deep_get(dct=self.data, path=self.path)
+        hs = self._hs
+        if self._version != hs._cache_version:
+            self._v = hs._lookup(self._path)
+            self._version = hs._cache_version
+        return self._v
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class HomeSecretToml:
     """
     Main interface for loading and accessing secrets from a home_secret.toml file.
@@ -150,23 +263,103 @@ class HomeSecretToml:
     - **Caching**: Parsed TOML data is cached for subsequent access
     - **Flexible Access**: Supports both direct value access and token creation
 
+    The class uses ``__slots__``, so the lazily loaded data lives in private
+    slots (``_cache_data``, ``_cache_flat``) instead of a per-instance ``__dict__``.
+    Those slots are never pickled or copied, so serializing an instance (or a
+    token) can't leak the secrets it has loaded.
+
     :param path: Path to the TOML secrets file. Defaults to $HOME/home_secret.toml
     """
 
-    path: Path = dataclasses.field(default_factory=lambda: p_home_secret)
-    _cache_v: dict[str, T.Any] = dataclasses.field(default_factory=dict, repr=False)
-    _cache_t: dict[str, Token] = dataclasses.field(default_factory=dict, repr=False)
+    path: Path = dataclasses.field(default=p_home_secret)
+    _cache_t: dict[str, Token] = dataclasses.field(
+        default_factory=dict, repr=False, compare=False
+    )
+    _cache_data: dict[str, T.Any] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cache_flat: dict[str, T.Any] | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _cache_version: int = dataclasses.field(
+        default=0, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict[str, T.Any]:
+        # Never serialize the parsed secrets, only where to read them from.
+        # An unpickled (or copied) instance re-reads the file on first access,
+        # and the tokens it handed out come back unresolved
+        return {"path": self.path, "_cache_t": self._cache_t}
+
+    def __setstate__(self, state: dict[str, T.Any]) -> None:
+        self.path = state["path"]
+        self._cache_t = state["_cache_t"]
+        self._cache_data = None
+        self._cache_flat = None
+        self._cache_version = 0
 
-    @cached_property
+    def __copy__(self) -> "HomeSecretToml":
+        # Tokens point back at the instance that created them, so a shallow
+        # copy can't share the token cache; it starts out empty instead
+        return self.__class__(path=self.path)
+
+    @property
     def data(self) -> dict[str, T.Any]:
         """
         Load and cache the secret data from the TOML file.
 
         :raises FileNotFoundError: If the secrets file does not exist at the specified path
         """
-        if not self.path.exists():
-            raise FileNotFoundError(f"Secret file not found at {self.path}")
-        return tomllib.loads(self.path.read_text(encoding="utf-8"))
+        if self._cache_data is None:
+            self._cache_data = self._load_data()
+        return self._cache_data
+
+    def reload(self) -> None:
+        """
+        Drop the cached data so the next access re-reads the TOML file.
+
+        Every token of this instance stays valid, whether it came from
+        :meth:`t` or was built directly; it resolves its value again from the
+        fresh data on the next ``.v`` access.
+        """
+        self._cache_data = None
+        self._cache_flat = None
+        self._cache_version += 1
+
+    def _load_data(self) -> dict[str, T.Any]:
+        """
+        Read and parse the TOML file.
+
+        :raises FileNotFoundError: If the secrets file does not exist at the specified path
+        """
+        tomllib = _get_tomllib()
+        # Read the whole file in one call, and let the read report a missing
+        # file instead of probing with exists() first
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Secret file not found at {self.path}") from None
+        return tomllib.loads(content.decode("utf-8"))
+
+    @property
+    def _flat(self) -> dict[str, T.Any]:
+        """
+        Flat ``{dot_path: value}`` view of :attr:`data`, built once on first use.
+        """
+        if self._cache_flat is None:
+            self._cache_flat = _flatten(self.data)
+        return self._cache_flat
+
+    def _lookup(self, path: str) -> T.Any:
+        """
+        Look up a dot-separated path in the flat table.
+
+        :raises KeyError: When the path doesn't exist, naming the first missing key
+        """
+        try:
+            return self._flat[path]
+        except KeyError:
+            raise _key_not_found(dct=self.data, path=path) from None
 
     def v(self, path: str) -> T.Any:
         """
@@ -180,9 +373,9 @@ class HomeSecretToml:
 
             V stands for Value.
         """
-        if path not in self._cache_v:
-            self._cache_v[path] = _deep_get(dct=self.data, path=path)
-        return self._cache_v[path]
+        # The flat table already holds every value, so there is no separate
+        # value cache, a lookup is a single dict probe
+        return self._lookup(path)
 
     def t(self, path: str) -> Token:
         """
@@ -199,13 +392,31 @@ class HomeSecretToml:
 
             T stands for Token.
         """
+        path = sys.intern(path)
         if path not in self._cache_t:
             self._cache_t[path] = Token(
-                data=self.data,
+                hs=self,
                 path=path,
             )
         return self._cache_t[path]
 
+    def resolve_many(self, paths: T.Iterable[str]) -> dict[str, T.Any]:
+        """
+        Resolve many secret paths at once.
+
+        The TOML data is loaded and flattened once, then every path is a single
+        lookup in the flat table, so resolving N paths doesn't walk the tree N
+        times. Used by the generated enum module to validate all its secrets.
+
+        :param paths: Dot-separated paths to resolve
+
+        :raises KeyError: When any of the paths doesn't exist
+
+        :return: Dictionary mapping each path to its secret value
+        """
+        lookup = self._lookup
+        return {path: lookup(path) for path in paths}
+
 
 # Global instance: Single shared secrets manager for the entire application
 # This follows the singleton pattern to ensure consistent access to secrets
@@ -213,17 +424,49 @@ class HomeSecretToml:
 # Uses the default path: $HOME/home_secret.toml
 hs = HomeSecretToml()
 
-UNKNOWN = "..."
+UNKNOWN = sys.intern("...")
 DESCRIPTION = "description"
 TAB = " " * 4
 
+# Header and footer of the generated ``home_secret_enum.py``, already written
+# at column zero so no ``textwrap.dedent`` is needed
+_ENUM_HEADER = """
+try:
+    from home_secret_toml import hs
+except ImportError:  # pragma: no cover
+    pass
+
+
+class Secret:
+    # fmt: off
+"""
+_ENUM_FOOTER = """
+    # fmt: on
+
+
+def _validate_secret():
+    print("Validate secret:")
+    tokens = {
+        key: token
+        for key, token in Secret.__dict__.items()
+        if key.startswith("_") is False
+    }
+    values = hs.resolve_many([token.path for token in tokens.values()])
+    for key, token in tokens.items():
+        print(f"{key} = {values[token.path]}")
+
+
+if __name__ == "__main__":
+    _validate_secret()
+"""
+
 
 def walk(
     dct: dict[str, T.Any],
     _parent_path: str = "",
 ) -> T.Iterable[tuple[str, T.Any]]:
     """
-    Recursively traverse a nested dictionary structure to extract all leaf paths and values.
+    Traverse a nested dictionary structure to extract all leaf paths and values.
 
     This function performs a depth-first traversal of the secrets TOML structure,
     yielding dot-separated paths to all non-dictionary values while filtering out
@@ -231,13 +474,13 @@ def walk(
 
     **Filtering Logic**:
 
-    - Recursively descends into dictionary values
-    - Skips 'description' keys (metadata)
+    - Skips 'description' keys (metadata), including whole 'description' tables
+    - Descends into all other dictionary values
     - Skips values equal to UNKNOWN ("..." placeholder)
     - Yields complete dot-separated paths for all other leaf values
 
     :param dct: Dictionary to traverse (typically the loaded secrets TOML)
-    :param _parent_path: Current path prefix for recursive calls (internal use)
+    :param _parent_path: Path prefix prepended to every yielded path (internal use)
 
     :yields: Tuples of (path, value) where path is dot-separated and value is the leaf data
 
@@ -258,24 +501,75 @@ def walk(
         # Results in:
         # ("github.accounts.personal.account_id", "user123")
     """
-    for key, value in dct.items():
-        path = f"{_parent_path}.{key}" if _parent_path else key
-        if isinstance(value, dict):
-            yield from walk(
-                dct=value,
-                _parent_path=path,
-            )
-        elif key == DESCRIPTION:
-            continue
-        elif value == UNKNOWN:
-            continue
+    # Bind the module constants to locals for faster lookup inside the loop
+    description = DESCRIPTION
+    unknown = UNKNOWN
+    # Explicit stack of (path prefix, items iterator) pairs instead of recursion,
+    # so the whole traversal runs in a single generator frame. Iterators are
+    # resumed in place, which keeps the output in TOML insertion order.
+    # The prefix is a tuple of key segments, joined into a string only for
+    # the leaves that are actually yielded.
+    stack = [((_parent_path,) if _parent_path else (), iter(dct.items()))]
+    while stack:
+        parts, items = stack[-1]
+        for key, value in items:
+            if key == description:
+                # Checked before descending, so a description table is
+                # pruned together with its whole sub-tree
+                continue
+            elif isinstance(value, dict):
+                stack.append((parts + (key,), iter(value.items())))
+                break  # descend into the sub-dict first
+            elif type(value) is str and value == unknown:
+                # Only strings can be the placeholder, so ints, bools, lists
+                # and dates skip the rich comparison entirely
+                continue
+            else:
+                yield ".".join(parts + (key,)), value
         else:
-            yield path, value
+            stack.pop()  # this level is exhausted
+
+
+@functools.lru_cache(maxsize=4096)
+def _attrify(path: str) -> str:
+    """
+    Transform a dot-separated secret path into a valid Python attribute name.
+
+    Dots are converted to double underscores, so the complete path hierarchy
+    is preserved in the name. Results are memoized because the same paths are
+    converted every time the enum file is regenerated.
+
+    :param path: Dot-separated path (e.g., "github.accounts.personal.account_id")
+
+    :return: Attribute name (e.g., "github__accounts__personal__account_id")
+    """
+    return path.replace(".", "__")
+
+
+def _render_enum_code(hs_instance: HomeSecretToml) -> str:
+    """
+    Render the source code of the ``home_secret_enum.py`` file.
+
+    The code is assembled from fragments in a single pass over :func:`walk`
+    and joined once, so the caller can write it out with one call.
+
+    :param hs_instance: HomeSecretToml instance to use for reading secrets
+
+    :return: The generated Python source code
+    """
+    parts = [_ENUM_HEADER, "\n"]
+    # Generate an attribute for each secret path discovered in the TOML data
+    for path, _ in walk(hs_instance.data):
+        parts.append(f'{TAB}{_attrify(path)} = hs.t("{path}")\n')
+    # Add validation function and main block to the generated file
+    parts.append(_ENUM_FOOTER)
+    return "".join(parts)
 
 
 def gen_enum_code(
     hs_instance: HomeSecretToml | None = None,
     output_path: Path | None = None,
+    skip_if_fresh: bool = False,
 ) -> None:
     """
     Generate a flat enumeration class providing direct attribute access to all secrets.
@@ -296,64 +590,85 @@ def gen_enum_code(
     :param hs_instance: HomeSecretToml instance to use for reading secrets.
                         Defaults to the global hs instance.
     :param output_path: Path to write the generated file. Defaults to ./home_secret_enum.py
+    :param skip_if_fresh: If True, do nothing when the output file is at least as
+        new as the secrets file, so repeated calls on an unchanged TOML cost two
+        ``stat`` calls instead of a full regeneration.
     """
     if hs_instance is None:
         hs_instance = hs
     if output_path is None:
         output_path = p_here_enum
 
-    # Build the generated file content line by line
-    lines = [
-        textwrap.dedent(
-            """
+    if skip_if_fresh:
         try:
-            from home_secret_toml import hs
-        except ImportError:  # pragma: no cover
-            pass
+            if output_path.stat().st_mtime_ns >= hs_instance.path.stat().st_mtime_ns:
+                return
+        except FileNotFoundError:
+            pass  # no output yet, or no secrets file (reported below)
 
+    # Render before opening the output, so a missing or malformed secret file
+    # doesn't leave a truncated enum file behind
+    code = _render_enum_code(hs_instance)
+    # Write the generated code to the enum file in a single call
+    output_path.write_text(code, encoding="utf-8")
 
-        class Secret:
-            # fmt: off
-        """
-        )
-    ]
 
-    # Extract all secret paths from the loaded TOML data
-    path_list = [path for path, _ in walk(hs_instance.data)]
+# ------------------------------------------------------------------------------
+# CLI Functions
+# ------------------------------------------------------------------------------
+_HS_CACHE_SIZE = 16
 
-    # Generate an attribute for each discovered secret path
-    for path in path_list:
-        # Transform the path into a valid Python attribute name
-        # Convert dots to double underscores
-        attr_name = path.replace(".", "__")
-        lines.append(f'{TAB}{attr_name} = hs.t("{path}")')
+# Shared instances used by the CLI helpers:
+# path -> ((mtime_ns, size), instance), kept in least-recently-used order
+_hs_cache: collections.OrderedDict[
+    Path, tuple[tuple[int, int], HomeSecretToml]
+] = collections.OrderedDict()
 
-    # Add validation function and main block to the generated file
-    lines.append(
-        textwrap.dedent(
-            """
-            # fmt: on
 
+def _hs_for(path: Path | None = None) -> HomeSecretToml:
+    """
+    Get a shared :class:`HomeSecretToml` instance for the given secrets file.
 
-        def _validate_secret():
-            print("Validate secret:")
-            for key, token in Secret.__dict__.items():
-                if key.startswith("_") is False:
-                    print(f"{key} = {token.v}")
+    The module-level helpers (:func:`list_secrets`, :func:`get_secret`,
+    :func:`generate_enum`) use this instead of creating a new instance per call,
+    so calling them repeatedly on the same file parses the TOML only once.
+    The file's modification time and size are checked on every call, and the
+    instance is reloaded when either has changed since it was parsed. The size
+    catches edits made within one timestamp tick on coarse-clock file systems.
 
+    :param path: Path to the TOML secrets file. Defaults to $HOME/home_secret.toml,
+        the module-level path built once at import time
 
-        if __name__ == "__main__":
-            _validate_secret()
-        """
-        )
-    )
-    # Write the generated code to the enum file
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    :raises FileNotFoundError: If the secrets file does not exist
+
+    :return: The cached instance for that path
+    """
+    if path is None:
+        path = p_home_secret
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Secret file not found at {path}") from None
+    signature = (st.st_mtime_ns, st.st_size)
+
+    entry = _hs_cache.get(path)
+    if entry is None:
+        hs_instance = HomeSecretToml(path=path)
+        _hs_cache[path] = (signature, hs_instance)
+        if len(_hs_cache) > _HS_CACHE_SIZE:
+            _hs_cache.popitem(last=False)  # evict the least recently used
+    else:
+        cached_signature, hs_instance = entry
+        if cached_signature != signature:
+            hs_instance.reload()
+            _hs_cache[path] = (signature, hs_instance)
+        _hs_cache.move_to_end(path)
+    return hs_instance
+
+
+_MASK = "***"
 
 
-# ------------------------------------------------------------------------------
-# CLI Functions
-# ------------------------------------------------------------------------------
 def mask_value(value: T.Any) -> str:
     """
     Mask a secret value for safe display.
@@ -368,18 +683,20 @@ def mask_value(value: T.Any) -> str:
 
     :return: Masked string representation
     """
-    if not isinstance(value, str):
+    # Exact type check, cheaper than isinstance on the common string path
+    if type(value) is not str:
         return "*"
-    if len(value) > 8:
-        return f"{value[:2]}***{value[-2:]}"
-    else:
-        return "***"
+    return f"{value[:2]}{_MASK}{value[-2:]}" if len(value) > 8 else _MASK
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_for_match(s: str) -> str:
     """
     Normalize a string for matching by converting to lowercase and replacing dashes with underscores.
 
+    Results are memoized, since the same secret keys are normalized again for
+    every query.
+
     :param s: The string to normalize
 
     :return: Normalized string
@@ -438,24 +755,22 @@ def list_secrets(
 
     :return: List of (key, masked_value) tuples
     """
-    if path is None:
-        path = p_home_secret
-
-    hs_instance = HomeSecretToml(path=path)
+    hs_instance = _hs_for(path)
     data = hs_instance.data
 
-    results = list(walk(data))
-
-    if query:
-        facets = _parse_query_facets(query)
-        if facets:
-            results = [
-                (key, value)
-                for key, value in results
-                if _matches_all_facets(key, facets)
-            ]
-
-    return [(key, mask_value(value)) for key, value in results]
+    facets = _parse_query_facets(query) if query else None
+    # Walk, filter and mask in a single pass, without intermediate lists
+    if not facets:
+        return [(key, mask_value(value)) for key, value in walk(data)]
+
+    # Try the longest (usually most selective) facet first, so most
+    # non-matching keys are rejected by the first check in all()
+    facets.sort(key=len, reverse=True)
+    return [
+        (key, mask_value(value))
+        for key, value in walk(data)
+        if _matches_all_facets(key, facets)
+    ]
 
 
 def cmd_ls(
@@ -494,6 +809,10 @@ def get_secret(
 
     This is the underlying function for the ``hst get`` command.
 
+    The parsed file is shared between calls (see :func:`_hs_for`), so tables
+    and arrays are returned as deep copies: changing a returned value never
+    affects the result of a later call.
+
     :param key: Dot-separated path to the secret value (e.g., "github.accounts.personal.token")
     :param path: Path to the TOML secrets file. Defaults to $HOME/home_secret.toml
 
@@ -502,11 +821,10 @@ def get_secret(
 
     :return: The secret value
     """
-    if path is None:
-        path = p_home_secret
-
-    hs_instance = HomeSecretToml(path=path)
-    return hs_instance.v(key)
+    value = _hs_for(path).v(key)
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
 
 
 def cmd_get(
@@ -593,31 +911,33 @@ def generate_enum(
 
     :return: The path where the enum file was written
     """
-    if path is None:
-        path = p_home_secret
-
     # Determine output path
     if output is None:
-        output_path = Path("home_secret_enum.py")
+        output_path = p_here_enum
     else:
         output_path = output
         if output_path.is_dir():
-            output_path = output_path / "home_secret_enum.py"
+            output_path = output_path / p_here_enum.name
         elif not output_path.suffix == ".py":
             # Treat as directory if not ending with .py
-            output_path = output_path / "home_secret_enum.py"
+            output_path = output_path / p_here_enum.name
 
-    # Check if file exists and handle overwrite logic
-    if output_path.exists() and not overwrite:
-        raise FileExistsError(
-            f"{output_path} already exists. Use --overwrite to replace it."
-        )
+    # Render first, so a missing or malformed secrets file leaves no output behind
+    code = _render_enum_code(_hs_for(path))
 
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    hs_instance = HomeSecretToml(path=path)
-    gen_enum_code(hs_instance=hs_instance, output_path=output_path)
+    # Exclusive create ("x") lets open() do the existence check atomically,
+    # instead of a separate exists() probe followed by a write
+    mode = "w" if overwrite else "x"
+    try:
+        with output_path.open(mode, encoding="utf-8") as f:
+            f.write(code)
+    except FileExistsError:
+        raise FileExistsError(
+            f"{output_path} already exists. Use --overwrite to replace it."
+        ) from None
 
     return output_path
 
@@ -12,6 +12,8 @@ except ImportError:
     import tomli as tomllib
 from pathlib import Path
 
+from home_secret_toml import home_secret_toml
+from home_secret_toml.home_secret_toml import HomeSecretToml, _render_enum_code
 from home_secret_toml.paths import path_enum
 
 
@@ -20,19 +22,31 @@ dir_fixtures = path_enum.dir_unit_test / "fixtures"
 path_test_toml = dir_fixtures / "home_secret.toml"
 
 
-@pytest.fixture
-def home_secret_data() -> dict[str, T.Any]:
+@pytest.fixture(scope="session")
+def home_secret_bytes() -> bytes:
+    """
+    Fixture that returns the raw content of the test TOML fixture file.
+
+    The file is read once per test session and the same buffer is shared
+    by every test that needs it.
+    """
+    return path_test_toml.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def home_secret_data(home_secret_bytes: bytes) -> dict[str, T.Any]:
     """
     Fixture that loads and returns the test TOML data as a nested dictionary.
 
     This fixture provides the parsed TOML data from the test fixture file,
     which can be used directly in tests that need access to the raw data
-    structure without going through HomeSecretToml.
+    structure without going through HomeSecretToml. It is parsed once per
+    test session, so tests must treat it as read-only.
     """
-    return tomllib.loads(path_test_toml.read_text(encoding="utf-8"))
+    return tomllib.loads(home_secret_bytes.decode("utf-8"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def home_secret_path() -> Path:
     """
     Fixture that returns the path to the test TOML fixture file.
@@ -41,3 +55,47 @@ def home_secret_path() -> Path:
     a custom path pointing to the test fixture.
     """
     return path_test_toml
+
+
+@pytest.fixture(scope="class")
+def hs_shared(home_secret_path: Path) -> HomeSecretToml:
+    """
+    Fixture that returns a HomeSecretToml instance for the test fixture file.
+
+    One instance is created per test class, so the TOML is parsed once and
+    reused by every test in that class. Only use it in tests that do not
+    inspect or reset the instance's caches.
+    """
+    return HomeSecretToml(path=home_secret_path)
+
+
+@pytest.fixture(scope="class")
+def generated_code(hs_shared: HomeSecretToml) -> str:
+    """
+    Fixture that renders the enum source code for the test fixture once per
+    test class.
+
+    Tests that only inspect the generated code share this single in-memory
+    rendering pass; writing the file is covered by the tests that call
+    gen_enum_code / generate_enum directly.
+    """
+    return _render_enum_code(hs_shared)
+
+
+@pytest.fixture
+def default_home_secret_path(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    home_secret_bytes: bytes,
+) -> Path:
+    """
+    Fixture that redirects the default ``$HOME/home_secret.toml`` path to a
+    temporary copy of the test fixture file.
+
+    Tests that exercise the default-path code paths use this, so they never
+    read or write the real home directory.
+    """
+    path = tmp_path / "home_secret.toml"
+    path.write_bytes(home_secret_bytes)
+    monkeypatch.setattr(home_secret_toml, "p_home_secret", path)
+    return path